@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_PASSWORD, CONF_URL, Platform
+from homeassistant.core import callback
 from homeassistant.loader import async_get_loaded_integration
 
 from . import const as fl
-from .api import FroniusApiClient
+from .api import StreamSource, async_get_client, async_remove_storage
 from .coordinator import FroniusCoordinator
 from .data import FroniusData
+from .fleet import get_fleet
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -34,23 +35,44 @@ async def async_setup_entry(
         hass=hass,
         logger=fl.LOGGER,
         name=fl.DOMAIN,
-        update_interval=timedelta(seconds=fl.UPDATE_INTERVAL),
+    )
+
+    client = await async_get_client(
+        hass=hass,
+        url=entry.data[CONF_URL],
+        passwd=entry.data[CONF_PASSWORD],
+    )
+    # Kept warm for a reload, closed if no setup picks it up. Also released when
+    # the setup fails, the retry gets the client again
+    entry.async_on_unload(client.async_release)
+
+    # Load translation while the first refresh fetches the other endpoints
+    entry.async_create_background_task(
+        hass,
+        client.async_get_translation(hass.config.language),
+        "fronius_local translation",
     )
 
     entry.runtime_data = FroniusData(
-        client=FroniusApiClient(
-            hass=hass,
-            url=entry.data[CONF_URL],
-            passwd=entry.data[CONF_PASSWORD],
-        ),
+        client=client,
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    # Create entities from the last run, the inverter may be asleep or slow
+    if cached := await client.async_load_cache():
+        coordinator.async_restore(cached)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), "fronius_local refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(get_fleet(hass).async_add(coordinator))
+
+    _async_start_stream(hass, entry)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
 
@@ -66,10 +88,43 @@ async def async_unload_entry(
     )
 
 
-async def async_reload_entry(
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: FroniusConfigEntry,
+) -> None:
+    """Remove persisted data of a deleted entry."""
+    await async_remove_storage(hass, entry.data[CONF_URL])
+
+
+async def async_update_options(
+    hass: HomeAssistant,
+    entry: FroniusConfigEntry,
+) -> None:
+    """Apply changed options in place, reload only for a new url or password."""
+    client = entry.runtime_data.client
+    if (client.url, client.passwd) != (entry.data[CONF_URL], entry.data[CONF_PASSWORD]):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    # Intervals are read on every poll, only the stream needs a restart
+    _async_start_stream(hass, entry)
+    get_fleet(hass).async_reschedule(entry.runtime_data.coordinator)
+
+
+@callback
+def _async_start_stream(
     hass: HomeAssistant,
     entry: FroniusConfigEntry,
 ) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Start the push stream of the configured path, stopping a running one."""
+    data = entry.runtime_data
+    if data.stream is not None:
+        data.stream.cancel()
+        data.stream = None
+
+    if path := entry.options.get(fl.CONF_STREAM_PATH):
+        data.stream = entry.async_create_background_task(
+            hass,
+            data.coordinator.async_run_source(StreamSource(data.client, path)),
+            "fronius_local stream",
+        )
@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
 
+import httpx
 from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers import httpx_client
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+from homeassistant.util.json import json_loads
+from homeassistant.util.ssl import client_context
 
 from . import auth
 from . import const as fl
+from .fleet import get_fleet
+from .metrics import Metrics
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+    from datetime import datetime
+
     from homeassistant.core import HomeAssistant
 
 
@@ -36,6 +53,104 @@ def get_type(data: dict, key: str) -> Platform:
     return Platform.SENSOR
 
 
+def translation_sections(data: dict) -> dict:
+    """Keep only the sections names are looked up in, error if none is present."""
+    sections = {k: data[k] for k in fl.TRANSLATION_SECTIONS if k in data}
+    if not sections:
+        msg = f"Translation without any of {fl.TRANSLATION_SECTIONS}"
+        raise ValueError(msg)
+    return sections
+
+
+async def async_get_client(
+    hass: HomeAssistant,
+    url: str,
+    passwd: str,
+) -> FroniusApiClient:
+    """Return the pooled client of an inverter, shared by config flow and entry."""
+    clients = get_fleet(hass).clients
+
+    client = clients.get(url)
+    if client is not None and client.passwd == passwd:
+        client.async_retain()
+        return client
+
+    if client is None or not client.in_use:
+        if client is not None:
+            await client.async_close()
+        client = clients[url] = FroniusApiClient(hass=hass, url=url, passwd=passwd)
+    else:
+        # Another password for a url in use, e.g. a config flow with a typo, gets
+        # an own client and leaves the pooled one to its entry
+        client = FroniusApiClient(hass=hass, url=url, passwd=passwd)
+    await client.async_load_auth()
+    return client
+
+
+async def async_remove_storage(hass: HomeAssistant, url: str) -> None:
+    """Remove persisted data of an inverter."""
+    await asyncio.gather(
+        _auth_store(hass, url).async_remove(),
+        _cache_store(hass, url).async_remove(),
+    )
+
+
+def _auth_store(hass: HomeAssistant, url: str) -> Store:
+    """Return storage of the learned digest challenge."""
+    return Store(hass, fl.STORAGE_VERSION, f"{fl.DOMAIN}.auth.{slugify(url)}")
+
+
+def _cache_store(hass: HomeAssistant, url: str) -> Store:
+    """Return storage of the last schema and config values."""
+    return Store(hass, fl.STORAGE_VERSION, f"{fl.DOMAIN}.cache.{slugify(url)}")
+
+
+class CircuitOpenError(Exception):
+    """Requests fail fast after repeated failures of the inverter."""
+
+
+class PushSource(ABC):
+    """Source pushing values of an endpoint, polling remains the fallback."""
+
+    endpoint: str
+
+    @abstractmethod
+    async def async_run(self, on_values: Callable[[dict], None]) -> None:
+        """Pass values to on_values until the source disconnects."""
+
+
+class StreamSource(PushSource):
+    """Power flow streamed as JSON lines over a request kept open."""
+
+    endpoint = fl.ENDPOINT_POWERFLOW
+
+    def __init__(self, client: FroniusApiClient, path: str) -> None:
+        """Init stream source."""
+        self._client = client
+        self._path = path
+
+    async def async_run(self, on_values: Callable[[dict], None]) -> None:
+        """Pass values to on_values until the stream ends or stalls."""
+        # Own connection, the stream would block one of the pooled ones
+        transport = httpx.AsyncHTTPTransport(verify=client_context())
+        http = httpx_client.create_async_httpx_client(
+            hass=self._client.hass,
+            auto_cleanup=False,
+            auth=self._client.auth,
+            base_url=self._client.url,
+            transport=transport,
+            timeout=httpx.Timeout(fl.STREAM_TIMEOUT, connect=fl.CONNECT_TIMEOUT),
+        )
+        try:
+            async with http.stream("GET", self._path) as res:
+                res.raise_for_status()
+                async for line in res.aiter_lines():
+                    if line:
+                        on_values(self._client.parse_powerflow(json_loads(line)))
+        finally:
+            await transport.aclose()
+
+
 class FroniusApiClient:
     """Fronius auth class."""
 
@@ -48,101 +163,487 @@ class FroniusApiClient:
         """Init auth."""
         self.hass = hass
         self.url = url
+        self.passwd = passwd
+        self._stats = {"requests": 0, "connections": 0}
+        # Timings and counters per request path
+        self.metrics: defaultdict[str, Metrics] = defaultdict(Metrics)
+        # Own pool, the inverter is slow to accept new connections
+        self._transport = httpx.AsyncHTTPTransport(
+            verify=client_context(),
+            limits=httpx.Limits(
+                max_connections=fl.MAX_CONCURRENT_REQUESTS,
+                max_keepalive_connections=fl.MAX_CONCURRENT_REQUESTS,
+                keepalive_expiry=fl.KEEPALIVE_EXPIRY,
+            ),
+        )
+        # Shared with push sources, so they reuse the learned challenge
+        self.auth = auth.DigestAuthX(
+            "customer", passwd, on_challenge=self._async_save_auth
+        )
+        self._auth_store = _auth_store(hass, url)
+        self._cache_store = _cache_store(hass, url)
         self.httpx = httpx_client.create_async_httpx_client(
             hass=hass,
-            auth=auth.DigestAuthX("customer", passwd),
+            auto_cleanup=False,
+            auth=self.auth,
             base_url=url,
+            transport=self._transport,
+            timeout=httpx.Timeout(fl.REQUEST_TIMEOUT, connect=fl.CONNECT_TIMEOUT),
+            event_hooks={
+                "request": [self._async_on_request],
+                "response": [self._async_on_response],
+            },
         )
-        self.trans = None
+        self._fleet = get_fleet(hass)
+        self.trans = self._fleet.translations
+        self._trans_lock = self._fleet.translation_lock
+        # Static entity data, only values change between polls
+        self.schema: dict[str, dict] = {}
+        self._signature: dict[str, Any] = {}
+        self._semaphore = asyncio.Semaphore(fl.MAX_CONCURRENT_REQUESTS)
+        # Writes queued per endpoint, with the future of their POST and the
+        # callbacks re-reading the endpoint once it is written
+        self._pending: dict[
+            str, tuple[dict, asyncio.Future, set[Callable[[str], Awaitable[None]]]]
+        ] = {}
+        self._write_lock = asyncio.Lock()
+        self._timeofuse: list[dict] | None = None
+        # Config flows and entries using the client, closed after the last one
+        self._users = 1
+        self._unsub_release: CALLBACK_TYPE | None = None
+        # Circuit breaker, consecutive failed requests and when to try again
+        self._failures = 0
+        self._open_until = 0.0
+        self._battery_keys: list[tuple[str, str]] = []
+        # Last values of the config endpoints and how to detect they are unchanged
+        self._values: dict[str, dict] = {}
+        self._validators: dict[str, tuple[str | None, str | None, bytes]] = {}
+
+    @property
+    def connection_stats(self) -> dict[str, int]:
+        """Return request and connection counts of the pool."""
+        return self._stats | {
+            "reused": self._stats["requests"] - self._stats["connections"]
+        }
+
+    @property
+    def in_use(self) -> bool:
+        """Return if a config flow or entry uses the client."""
+        return self._users > 0
+
+    @property
+    def circuit_open(self) -> bool:
+        """Return if requests fail fast after repeated failures."""
+        return time.monotonic() < self._open_until
+
+    @property
+    def nonce_lifetime(self) -> float | None:
+        """Return the observed seconds until the inverter expires a nonce."""
+        return self.auth.nonce_lifetime
+
+    async def _async_on_request(self, request: httpx.Request) -> None:
+        """Count requests and trace connect and server time."""
+        self._stats["requests"] += 1
+        metrics = self.metrics[request.url.path]
+        metrics.count("requests")
+        started: dict[str, float] = {}
+
+        async def trace(event: str, _info: dict) -> None:
+            name, _, phase = event.rpartition(".")
+            if phase == "started":
+                started[name] = time.perf_counter()
+            elif phase == "complete" and name in started:
+                seconds = time.perf_counter() - started.pop(name)
+                if name == "connection.connect_tcp":
+                    self._stats["connections"] += 1
+                    metrics.observe("connect", seconds)
+                elif name == "http11.receive_response_headers":
+                    metrics.observe("server", seconds)
+
+        request.extensions["trace"] = trace
+
+    async def _async_on_response(self, response: httpx.Response) -> None:
+        """Count digest challenges, each costs another round trip."""
+        if response.status_code == httpx.codes.UNAUTHORIZED:
+            self.metrics[response.request.url.path].count("auth_retries")
+
+    async def async_load_auth(self) -> None:
+        """Restore the digest challenge learned before a restart or reload."""
+        state = await self._auth_store.async_load()
+        if state:
+            self.auth.restore(state)
+
+    @callback
+    def _async_save_auth(self) -> None:
+        """Persist the digest challenge and a bound of its nonce counts."""
+        self._auth_store.async_delay_save(self.auth.dump, fl.AUTH_SAVE_DELAY)
+
+    async def async_load_cache(self) -> dict[str, dict]:
+        """Restore the schema of the last run, return its config values."""
+        if self.schema:
+            # Client kept warm, e.g. by the config flow
+            return dict(self._values)
+
+        cached = await self._cache_store.async_load()
+        if not cached:
+            return {}
+
+        self.schema = cached["schema"]
+        return cached["values"]
+
+    @callback
+    def _async_save_cache(self) -> None:
+        """Persist schema and config values to create entities on next start."""
+        self._cache_store.async_delay_save(
+            lambda: {"schema": self.schema, "values": self._values},
+            fl.CACHE_SAVE_DELAY,
+        )
+
+    @callback
+    def async_release(self) -> None:
+        """Drop a user, after the last one close unless a setup picks it up again."""
+        self._users -= 1
+        if self._users > 0:
+            return
+        self._async_cancel_release()
+        self._unsub_release = async_call_later(
+            self.hass, fl.CLIENT_LINGER, self._async_close_released
+        )
+
+    @callback
+    def async_retain(self) -> None:
+        """Add a user, keeping a released client open."""
+        self._users += 1
+        self._async_cancel_release()
+
+    @callback
+    def _async_cancel_release(self) -> None:
+        """Cancel closing a released client."""
+        if self._unsub_release is not None:
+            self._unsub_release()
+            self._unsub_release = None
+
+    async def _async_close_released(self, _now: datetime) -> None:
+        """Close a client nobody picked up again."""
+        self._unsub_release = None
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close pooled connections."""
+        self._async_cancel_release()
+        clients = self._fleet.clients
+        if clients.get(self.url) is self:
+            del clients[self.url]
+        await self._transport.aclose()
 
     async def async_get_translation(self, lang: str) -> dict:
         """Return translated names."""
-        if self.trans is None:
-            self.trans = {}
-
-        if self.trans.get(lang) is None:
-            if lang not in fl.SUPPORTED_LOCALES:
-                lang = "en"
-            self.trans[lang] = await self.get(
-                "/app/assets/i18n/WeblateTranslations/config/" + lang + ".json"
-            )
+        if lang not in fl.SUPPORTED_LOCALES:
+            lang = "en"
+
+        async with self._trans_lock:
+            if lang not in self.trans:
+                self.trans[lang] = await self._async_load_translation(lang)
 
         return self.trans[lang]
 
+    async def _async_load_translation(self, lang: str) -> dict:
+        """Load translation from storage, download if missing or outdated."""
+        store = Store(self.hass, fl.STORAGE_VERSION, f"{fl.DOMAIN}.translation.{lang}")
+        cached = await store.async_load()
+        if cached and time.time() - cached["fetched"] < fl.TRANSLATION_MAX_AGE:
+            return cached["data"]
+
+        try:
+            data = translation_sections(
+                await self.get(fl.TRANSLATION_PATH + lang + ".json")
+            )
+        except (httpx.HTTPError, ValueError, TimeoutError, CircuitOpenError):
+            if cached is None:
+                raise
+            fl.LOGGER.warning("Using outdated translation %s, download failed", lang)
+            return cached["data"]
+
+        await store.async_save({"fetched": time.time(), "data": data})
+        return data
+
     async def async_get_hwid(self) -> str:
         """Return Hardware ID."""
         return (await self.get("/status/version"))["hardwareId"]
 
-    async def async_get_data(self) -> dict:
-        """Update data."""
-        battery = await self.get("/api/config/batteries")
-
-        battery = {
-            "conf_batteries_" + k: {
-                "value": v,
-                "type": get_type(battery, k),
-                "name": (await self.async_get_translation(self.hass.config.language))[
-                    "BATTERIES"
-                ].get(k)
-                or "CONF_BATTERIES_" + k,
-                "id": k,
-                "url": "/api/config/batteries",
-                "unit": battery[meta(k)].get("unit"),
-                "val": battery[meta(k)].get("validators"),
-            }
-            for (k, v) in battery.items()
-            if not is_meta(k)
+    async def async_get_data(
+        self, endpoints: Iterable[str] = fl.ENDPOINT_INTERVALS
+    ) -> dict[str, dict]:
+        """Update data of the given endpoints, keyed by endpoint."""
+        fetchers = {
+            fl.ENDPOINT_BATTERIES: self.async_get_batteries,
+            fl.ENDPOINT_POWERFLOW: self.async_get_powerflow,
+            fl.ENDPOINT_TIMEOFUSE: self.async_get_timeofuse,
         }
+        endpoints = list(endpoints)
+        results = await asyncio.gather(
+            *(fetchers[endpoint]() for endpoint in endpoints),
+            return_exceptions=True,
+        )
 
-        powerflow = await self.get("/api/status/powerflow")
-
-        powerflow = {
-            k: {
-                "value": v,
-                "type": Platform.SENSOR,
-                "name": k,
-                "id": k,
-                "url": "/api/status/powerflow",
-                "unit": None,
-            }
-            for (k, v) in powerflow.get("site").items()
-        }
+        data = {}
+        errors = []
+        for endpoint, result in zip(endpoints, results, strict=True):
+            if isinstance(result, BaseException):
+                self.metrics[endpoint].count("errors")
+                errors.append(result)
+                continue
+            data[endpoint] = result
+
+        if not data:
+            raise errors[0]
+        for err in errors:
+            fl.LOGGER.warning("Partial update from %s failed: %s", self.url, err)
 
-        timeofuse = await self.get("/api/config/timeofuse")
-
-        timeofuse = {
-            "timeuse_" + str(idx + 1): {
-                "value": item.get("Active"),
-                "type": Platform.SWITCH,
-                "name": "Active " + str(idx + 1),
-                "id": "timeuse_" + str(idx + 1),
-                "nr": idx,
-                "url": "/api/config/timeofuse",
-                "unit": None,
-            }
-            for idx, item in enumerate(timeofuse.get("timeofuse"))
+        return data
+
+    def _update_schema(
+        self, endpoint: str, signature: Any, build: Callable[[], dict]
+    ) -> None:
+        """Rebuild entity schema of an endpoint if its signature changed."""
+        if self._signature.get(endpoint) == signature:
+            return
+
+        self.schema = {
+            k: v for k, v in self.schema.items() if v["url"] != endpoint
+        } | build()
+        self._signature[endpoint] = signature
+
+    async def async_get_batteries(self) -> dict:
+        """Fetch battery config."""
+        battery = await self.get_changed(fl.ENDPOINT_BATTERIES)
+        if battery is None:
+            return self._values[fl.ENDPOINT_BATTERIES]
+
+        # Meta data only changes along with the keys, e.g. on firmware updates,
+        # so steady polls only pick the values
+        keys = frozenset(battery)
+        if self._signature.get(fl.ENDPOINT_BATTERIES) != keys:
+            trans = await self.async_get_translation(self.hass.config.language)
+            names = trans.get("BATTERIES", {})
+            self._update_schema(
+                fl.ENDPOINT_BATTERIES,
+                keys,
+                lambda: {
+                    "conf_batteries_" + k: {
+                        "type": get_type(battery, k),
+                        "name": names.get(k) or "CONF_BATTERIES_" + k,
+                        "id": k,
+                        "url": fl.ENDPOINT_BATTERIES,
+                        "unit": battery[meta(k)].get("unit"),
+                        "val": battery[meta(k)].get("validators"),
+                    }
+                    for k in battery
+                    if not is_meta(k)
+                },
+            )
+            self._battery_keys = [
+                (key, info["id"])
+                for key, info in self.schema.items()
+                if info["url"] == fl.ENDPOINT_BATTERIES
+            ]
+
+        values = {key: battery[k] for key, k in self._battery_keys}
+        self._values[fl.ENDPOINT_BATTERIES] = values
+        self._async_save_cache()
+        return values
+
+    async def async_get_powerflow(self) -> dict:
+        """Fetch power flow status."""
+        return self.parse_powerflow(await self.get(fl.ENDPOINT_POWERFLOW))
+
+    def parse_powerflow(self, data: dict) -> dict:
+        """Return power flow values, polled or pushed."""
+        powerflow = data.get("site")
+
+        self._update_schema(
+            fl.ENDPOINT_POWERFLOW,
+            powerflow.keys(),
+            lambda: {
+                k: {
+                    "type": Platform.SENSOR,
+                    "name": k,
+                    "id": k,
+                    "url": fl.ENDPOINT_POWERFLOW,
+                    "unit": None,
+                }
+                for k in powerflow
+            },
+        )
+
+        return powerflow
+
+    async def async_get_timeofuse(self) -> dict:
+        """Fetch time of use config."""
+        data = await self.get_changed(fl.ENDPOINT_TIMEOFUSE)
+        if data is None:
+            return self._values[fl.ENDPOINT_TIMEOFUSE]
+
+        timeofuse = data.get("timeofuse")
+        # Full slots are needed to write back a single toggled one
+        self._timeofuse = timeofuse
+
+        self._update_schema(
+            fl.ENDPOINT_TIMEOFUSE,
+            len(timeofuse),
+            lambda: {
+                "timeuse_" + str(idx + 1): {
+                    "type": Platform.SWITCH,
+                    "name": "Active " + str(idx + 1),
+                    "id": "timeuse_" + str(idx + 1),
+                    "nr": idx,
+                    "url": fl.ENDPOINT_TIMEOFUSE,
+                    "unit": None,
+                }
+                for idx in range(len(timeofuse))
+            },
+        )
+
+        values = {
+            "timeuse_" + str(idx + 1): item.get("Active")
+            for idx, item in enumerate(timeofuse)
         }
+        self._values[fl.ENDPOINT_TIMEOFUSE] = values
+        self._async_save_cache()
+        return values
+
+    async def async_write(
+        self,
+        endpoint: str,
+        changes: dict,
+        confirm: Callable[[str], Awaitable[None]] | None = None,
+    ) -> dict:
+        """Queue changes, posted and confirmed together with other writes."""
+        pending = self._pending.get(endpoint)
+        if pending is None:
+            pending = self._pending[endpoint] = (
+                {},
+                self.hass.loop.create_future(),
+                set(),
+            )
+            self.hass.async_create_background_task(
+                self._async_flush(endpoint), "fronius_local write"
+            )
+
+        pending[0].update(changes)
+        if confirm is not None:
+            pending[2].add(confirm)
+        return await asyncio.shield(pending[1])
 
-        return battery | powerflow | timeofuse
+    async def _async_flush(self, endpoint: str) -> None:
+        """Post the changes queued within the write delay."""
+        await asyncio.sleep(fl.WRITE_DELAY)
+        changes, future, confirms = self._pending.pop(endpoint)
 
-    async def async_set_timeofuse(self, idx: int, active: bool) -> None:
-        """Set timeofuse."""
-        timeofuse = await self.get("/api/config/timeofuse")
-        timeofuse = timeofuse.get("timeofuse")
-        timeofuse[idx]["Active"] = active
-        await self.post("/api/config/timeofuse", {"timeofuse": timeofuse})
+        error = None
+        try:
+            async with self._write_lock:
+                if endpoint == fl.ENDPOINT_TIMEOFUSE:
+                    if self._timeofuse is None:
+                        await self.async_get_timeofuse()
+                    timeofuse = [dict(item) for item in self._timeofuse]
+                    for idx, active in changes.items():
+                        timeofuse[idx]["Active"] = active
+                    result = await self.post(endpoint, {"timeofuse": timeofuse})
+                    self._timeofuse = timeofuse
+                else:
+                    result = await self.post(endpoint, changes)
+        except Exception as err:  # noqa: BLE001
+            error = err
+        finally:
+            # Parse the next read in full, even if the write had no effect
+            self._validators.pop(endpoint, None)
+
+        # Re-read failed writes too, the inverter is the truth to reconcile with
+        for confirm in confirms:
+            await confirm(endpoint)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
 
     async def post(self, path: str, data: dict) -> dict:
         """Request url from api."""
-        res = await self.httpx.post(
-            path,
-            json=data,
-        )
-
-        return res.json()
+        res = await self._request("POST", path, json=data)
+        res.raise_for_status()
+        return json_loads(res.content)
 
     async def get(self, path: str) -> dict:
         """Request url from api."""
-        res = await self.httpx.get(path, follow_redirects=True)
+        res = await self._request("GET", path, follow_redirects=True)
+        res.raise_for_status()
+        return self._parse(path, res)
+
+    async def get_changed(self, path: str) -> dict | None:
+        """Request url from api, None if unchanged since its values were stored."""
+        validators = self._validators.get(path) if path in self._values else None
+        headers = {}
+        if validators is not None:
+            etag, modified, _ = validators
+            if etag:
+                headers["If-None-Match"] = etag
+            if modified:
+                headers["If-Modified-Since"] = modified
+
+        res = await self._request("GET", path, headers=headers, follow_redirects=True)
+        if validators is not None and res.status_code == httpx.codes.NOT_MODIFIED:
+            self.metrics[path].count("not_modified")
+            return None
+        res.raise_for_status()
+
+        # Not every firmware sends validators, an equal body is unchanged too
+        digest = hashlib.blake2b(res.content, digest_size=16).digest()
+        if validators is not None and validators[2] == digest:
+            self.metrics[path].count("unchanged")
+            return None
+
+        data = self._parse(path, res)
+        self._validators[path] = (
+            res.headers.get("ETag"),
+            res.headers.get("Last-Modified"),
+            digest,
+        )
+        return data
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request within its deadline, timing it."""
+        now = time.monotonic()
+        if now < self._open_until:
+            self.metrics[path].count("rejected")
+            msg = f"{self.url} failed {self._failures} times in a row"
+            raise CircuitOpenError(msg)
+        if self._failures >= fl.BREAKER_THRESHOLD:
+            # Half open, a single trial request decides
+            self._open_until = now + fl.REQUEST_DEADLINE
+
+        # The deadline starts once a slot is free, requests of other inverters
+        # holding the fleet's slots do not count as failures of this one
+        async with self._semaphore, self._fleet.semaphore:
+            try:
+                async with asyncio.timeout(fl.REQUEST_DEADLINE):
+                    start = time.perf_counter()
+                    res = await self.httpx.request(method, path, **kwargs)
+                    self.metrics[path].observe("request", time.perf_counter() - start)
+            except (httpx.TransportError, TimeoutError):
+                self._failures += 1
+                if self._failures >= fl.BREAKER_THRESHOLD:
+                    self._open_until = time.monotonic() + fl.BREAKER_COOLDOWN
+                raise
+
+        self._failures = 0
+        self._open_until = 0.0
+        return res
 
-        return res.json()
+    def _parse(self, path: str, res: httpx.Response) -> dict:
+        """Decode a response, timing it."""
+        metrics = self.metrics[path]
+        start = time.perf_counter()
+        # orjson, decodes the raw bytes without building a str first
+        data = json_loads(res.content)
+        metrics.observe("parse", time.perf_counter() - start)
+        return data
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import os
 import re
@@ -7,7 +8,7 @@ import time
 import typing
 from urllib.request import parse_http_list
 
-from httpx import Auth
+from httpx import Auth, SyncByteStream
 from httpx._exceptions import ProtocolError
 from httpx._models import Cookies, Request, Response
 from httpx._utils import to_bytes, to_str, unquote
@@ -29,17 +30,104 @@ class DigestAuthX(Auth):
         "SHA512": hashlib.sha512,
         "SHA-512-SESS": hashlib.sha512,
     }
-
-    def __init__(self, username: str | bytes, password: str | bytes) -> None:
+    # Nonce counts persisted ahead of the used ones, a challenge restored after a
+    # restart or crash never repeats a count the inverter has already seen
+    _NONCE_COUNT_RESERVE = 1024
+
+    def __init__(
+        self,
+        username: str | bytes,
+        password: str | bytes,
+        on_challenge: typing.Callable[[], None] | None = None,
+    ) -> None:
         self._username = to_bytes(username)
         self._password = to_bytes(password)
         self._last_challenge: _DigestAuthChallenge | None = None
         self._nonce_count = 1
+        # Bound of the nonce counts in the last dump and if a new one is pending
+        self._saved_nonce_count = 0
+        self._saving = False
+        self._challenge_time = 0.0
+        # Observed seconds until the inverter expires a nonce
+        self.nonce_lifetime: float | None = None
+        self._ha1_cache: dict[tuple[bytes, str], bytes] = {}
+        self._on_challenge = on_challenge
+        # Set while the first request learns a challenge, others wait for it
+        self._learning: asyncio.Event | None = None
+
+    def dump(self) -> dict[str, typing.Any] | None:
+        """Return the learned challenge for persistence."""
+        self._saving = False
+        challenge = self._last_challenge
+        if challenge is None:
+            return None
+
+        self._saved_nonce_count = self._nonce_count + self._NONCE_COUNT_RESERVE
+        return {
+            "realm": to_str(challenge.realm),
+            "nonce": to_str(challenge.nonce),
+            "algorithm": challenge.algorithm,
+            "opaque": to_str(challenge.opaque) if challenge.opaque else None,
+            "qop": to_str(challenge.qop) if challenge.qop else None,
+            "nonce_count": self._saved_nonce_count,
+            "time": self._challenge_time,
+            "lifetime": self.nonce_lifetime,
+        }
+
+    def restore(self, state: dict[str, typing.Any]) -> None:
+        """Reuse a persisted challenge unless its nonce is known to be expired."""
+        self.nonce_lifetime = state["lifetime"]
+        if (
+            self.nonce_lifetime is not None
+            and time.time() - state["time"] >= self.nonce_lifetime
+        ):
+            return
+
+        self._last_challenge = _DigestAuthChallenge(
+            realm=to_bytes(state["realm"]),
+            nonce=to_bytes(state["nonce"]),
+            algorithm=state["algorithm"],
+            opaque=to_bytes(state["opaque"]) if state["opaque"] else None,
+            qop=to_bytes(state["qop"]) if state["qop"] else None,
+        )
+        self._nonce_count = self._saved_nonce_count = state["nonce_count"]
+        self._challenge_time = state["time"]
+
+    async def async_auth_flow(
+        self, request: Request
+    ) -> typing.AsyncGenerator[Request, Response]:
+        """Run the auth flow, requests wait for a challenge learned concurrently."""
+        learning = None
+        if self._last_challenge is None:
+            if self._learning is not None:
+                # Reuse the challenge another request is learning right now
+                await self._learning.wait()
+            else:
+                learning = self._learning = asyncio.Event()
+
+        if not isinstance(request.stream, SyncByteStream):
+            # auth-int hashes the body, async streams are read once for the retry
+            await request.aread()
+
+        try:
+            flow = self.auth_flow(request)
+            request = next(flow)
+            while True:
+                response = yield request
+                try:
+                    request = flow.send(response)
+                except StopIteration:
+                    break
+        finally:
+            if learning is not None:
+                self._learning = None
+                learning.set()
 
     def auth_flow(self, request: Request) -> typing.Generator[Request, Response, None]:
-        if self._last_challenge:
+        challenge = self._last_challenge
+        if challenge:
             request.headers["Authorization"] = self._build_auth_header(
-                request, self._last_challenge
+                request, challenge
             )
 
         response = yield request
@@ -57,8 +145,18 @@ class DigestAuthX(Auth):
             # header, then we don't need to build an authenticated request.
             return
 
-        self._last_challenge = self._parse_challenge(request, response, auth_header)
-        self._nonce_count = 1
+        if self._last_challenge is challenge:
+            # Only the first rejected request refreshes the challenge, requests
+            # still in flight with the old nonce retry with the new one
+            now = time.time()
+            if challenge:
+                # The previous nonce was rejected, remember how long it lasted
+                self.nonce_lifetime = now - self._challenge_time
+
+            self._last_challenge = self._parse_challenge(request, response, auth_header)
+            self._nonce_count = 1
+            self._challenge_time = now
+            self._request_save()
 
         request.headers["Authorization"] = self._build_auth_header(
             request, self._last_challenge
@@ -67,6 +165,12 @@ class DigestAuthX(Auth):
             Cookies(response.cookies).set_cookie_header(request=request)
         yield request
 
+    def _request_save(self) -> None:
+        """Ask for a dump, once until it is taken."""
+        if self._on_challenge is not None and not self._saving:
+            self._saving = True
+            self._on_challenge()
+
     def _parse_challenge(
         self, request: Request, response: Response, auth_header: str
     ) -> _DigestAuthChallenge:
@@ -106,25 +210,29 @@ class DigestAuthX(Auth):
         def digest(data: bytes) -> bytes:
             return hash_func(data).hexdigest().encode()
 
-        def digest_md5(data: bytes) -> bytes:
-            return hashlib.md5(data).hexdigest().encode()
-
-        A1 = b":".join((self._username, challenge.realm, self._password))
+        qop = self._resolve_qop(challenge.qop, request=request)
 
         path = request.url.raw_path
-        A2 = b":".join((request.method.encode(), path))
-        # TODO: implement auth-int
-        HA2 = digest(A2)
+        a2_fields = [request.method.encode(), path]
+        if qop == b"auth-int":
+            a2_fields.append(self._hash_body(request, hash_func))
+        HA2 = digest(b":".join(a2_fields))
 
+        # Allocated without awaiting, so concurrent requests never share a nc
         nc_value = b"%08x" % self._nonce_count
-        cnonce = self._get_client_nonce(self._nonce_count, challenge.nonce)
+        cnonce = self._get_client_nonce()
         self._nonce_count += 1
-
-        HA1 = digest_md5(A1)
+        if (
+            self._nonce_count
+            >= self._saved_nonce_count - self._NONCE_COUNT_RESERVE // 2
+        ):
+            # Persist a new bound before the used counts reach the saved one
+            self._request_save()
+
+        HA1 = self._get_ha1(challenge)
         if challenge.algorithm.lower().endswith("-sess"):
             HA1 = digest(b":".join((HA1, challenge.nonce, cnonce)))
 
-        qop = self._resolve_qop(challenge.qop, request=request)
         if qop is None:
             # Following RFC 2069
             digest_data = [HA1, challenge.nonce, HA2]
@@ -143,19 +251,32 @@ class DigestAuthX(Auth):
         if challenge.opaque:
             format_args["opaque"] = challenge.opaque
         if qop:
-            format_args["qop"] = b"auth"
+            format_args["qop"] = qop
             format_args["nc"] = nc_value
             format_args["cnonce"] = cnonce
 
         return "Digest " + self._get_header_value(format_args)
 
-    def _get_client_nonce(self, nonce_count: int, nonce: bytes) -> bytes:
-        s = str(nonce_count).encode()
-        s += nonce
-        s += time.ctime().encode()
-        s += os.urandom(8)
-
-        return hashlib.sha1(s).hexdigest()[:16].encode()
+    def _get_ha1(self, challenge: _DigestAuthChallenge) -> bytes:
+        # HA1 only depends on the credentials and realm, Fronius always uses MD5
+        key = (challenge.realm, challenge.algorithm)
+        if key not in self._ha1_cache:
+            A1 = b":".join((self._username, challenge.realm, self._password))
+            self._ha1_cache[key] = hashlib.md5(A1).hexdigest().encode()
+        return self._ha1_cache[key]
+
+    def _hash_body(
+        self, request: Request, hash_func: typing.Callable[[bytes], _Hash]
+    ) -> bytes:
+        # Feed the chunks of the replayable stream, no joined copy of the body
+        body_hash = hash_func(b"")
+        for chunk in request.stream:
+            body_hash.update(chunk)
+        return body_hash.hexdigest().encode()
+
+    def _get_client_nonce(self) -> bytes:
+        # Random bytes are already unpredictable, no need to hash them
+        return os.urandom(8).hex().encode()
 
     def _get_header_value(self, header_fields: dict[str, bytes]) -> str:
         NON_QUOTED_FIELDS = ("algorithm", "qop", "nc")
@@ -182,8 +303,8 @@ class DigestAuthX(Auth):
         if b"auth" in qops:
             return b"auth"
 
-        if qops == [b"auth-int"]:
-            raise NotImplementedError("Digest auth-int support is not yet implemented")
+        if b"auth-int" in qops:
+            return b"auth-int"
 
         message = f'Unexpected qop value "{qop!r}" in digest auth'
         raise ProtocolError(message, request=request)
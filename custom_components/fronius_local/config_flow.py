@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.const import CONF_PASSWORD, CONF_URL
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_URL
+from homeassistant.core import callback
 
 from . import const as fl
-from .api import FroniusApiClient
+from .api import async_get_client
 
 
 class FroniusLocalFlow(config_entries.ConfigFlow, domain=fl.DOMAIN):
     """ConfigFlow class for Fronius local."""
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> FroniusOptionsFlow:
+        """Return the options flow."""
+        return FroniusOptionsFlow(config_entry)
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -29,16 +40,23 @@ class FroniusLocalFlow(config_entries.ConfigFlow, domain=fl.DOMAIN):
             url = user_input[CONF_URL].strip()
             passwd = user_input[CONF_PASSWORD]
 
-            client = FroniusApiClient(
+            client = await async_get_client(
                 hass=self.hass,
                 url=url,
                 passwd=passwd,
             )
 
-            hwid = await client.async_get_hwid()
-            await self.async_set_unique_id(hwid)
+            # Released on success too, the entry setup picks it up while it lingers
+            try:
+                hwid, _ = await asyncio.gather(
+                    client.async_get_hwid(),
+                    client.async_get_translation(self.hass.config.language),
+                )
+                await self.async_set_unique_id(hwid)
 
-            await client.async_get_data()
+                await client.async_get_data()
+            finally:
+                client.async_release()
 
             fl.LOGGER.info("Auth valid!")
 
@@ -57,3 +75,112 @@ class FroniusLocalFlow(config_entries.ConfigFlow, domain=fl.DOMAIN):
             ),
             errors=errors,
         )
+
+
+class FroniusOptionsFlow(config_entries.OptionsFlow):
+    """OptionsFlow class for Fronius local."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Init options flow."""
+        self._entry = config_entry
+        self._options: dict = {}
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Async step init for the poll intervals."""
+        errors = {}
+
+        if user_input is not None:
+            if (
+                user_input[fl.CONF_MIN_INTERVAL]
+                <= user_input[CONF_SCAN_INTERVAL]
+                <= user_input[fl.CONF_MAX_INTERVAL]
+            ):
+                self._options = self._entry.options | user_input
+                return await self.async_step_publish()
+            errors["base"] = "invalid_interval"
+
+        options = self._entry.options
+        interval = vol.All(vol.Coerce(int), vol.Range(min=1))
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_SCAN_INTERVAL, fl.DEFAULT_SCAN_INTERVAL
+                        ),
+                    ): interval,
+                    vol.Required(
+                        fl.CONF_MIN_INTERVAL,
+                        default=options.get(
+                            fl.CONF_MIN_INTERVAL, fl.DEFAULT_MIN_INTERVAL
+                        ),
+                    ): interval,
+                    vol.Required(
+                        fl.CONF_MAX_INTERVAL,
+                        default=options.get(
+                            fl.CONF_MAX_INTERVAL, fl.DEFAULT_MAX_INTERVAL
+                        ),
+                    ): interval,
+                    vol.Required(
+                        fl.CONF_CONFIG_INTERVAL,
+                        default=options.get(
+                            fl.CONF_CONFIG_INTERVAL, fl.DEFAULT_CONFIG_INTERVAL
+                        ),
+                    ): interval,
+                    # Path of a JSON lines power flow stream, polled if empty
+                    vol.Optional(
+                        fl.CONF_STREAM_PATH,
+                        default=options.get(fl.CONF_STREAM_PATH, ""),
+                    ): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_publish(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Async step publish for the power flow publishing policy."""
+        errors = {}
+
+        if user_input is not None:
+            if (
+                user_input[fl.CONF_MIN_PUBLISH_INTERVAL]
+                <= user_input[fl.CONF_MAX_PUBLISH_INTERVAL]
+            ):
+                return self.async_create_entry(data=self._options | user_input)
+            errors["base"] = "invalid_interval"
+
+        options = self._options
+        number = vol.All(vol.Coerce(float), vol.Range(min=0))
+        return self.async_show_form(
+            step_id="publish",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        key,
+                        default=options.get(key, default),
+                    ): number
+                    for key, default in (
+                        (fl.CONF_POWER_DEADBAND, fl.DEFAULT_POWER_DEADBAND),
+                        (fl.CONF_RELATIVE_DEADBAND, fl.DEFAULT_RELATIVE_DEADBAND),
+                        (fl.CONF_PERCENT_DEADBAND, fl.DEFAULT_PERCENT_DEADBAND),
+                        (
+                            fl.CONF_MIN_PUBLISH_INTERVAL,
+                            fl.DEFAULT_MIN_PUBLISH_INTERVAL,
+                        ),
+                        (
+                            fl.CONF_MAX_PUBLISH_INTERVAL,
+                            fl.DEFAULT_MAX_PUBLISH_INTERVAL,
+                        ),
+                    )
+                }
+            ),
+            errors=errors,
+        )
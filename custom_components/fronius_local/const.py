@@ -9,7 +9,97 @@ ATTRIBUTION = "Data fetched from the local Fronius API"
 
 LOGGER: logging.Logger = logging.getLogger(DOMAIN)
 
-UPDATE_INTERVAL = 9
+ENDPOINT_BATTERIES = "/api/config/batteries"
+ENDPOINT_POWERFLOW = "/api/status/powerflow"
+ENDPOINT_TIMEOFUSE = "/api/config/timeofuse"
+
+CONF_CONFIG_INTERVAL = "config_interval"
+# Seconds between fetches of the config endpoints, config only changes on edits
+DEFAULT_CONFIG_INTERVAL = 300
+
+# Default poll interval per endpoint in seconds, the config interval option
+# replaces the non-zero ones. Power flow is fetched on every poll, the poll
+# interval itself adapts.
+ENDPOINT_INTERVALS = {
+    ENDPOINT_BATTERIES: DEFAULT_CONFIG_INTERVAL,
+    ENDPOINT_POWERFLOW: 0,
+    ENDPOINT_TIMEOFUSE: DEFAULT_CONFIG_INTERVAL,
+}
+
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
+# Poll interval in seconds, fastest while power changes, slowest without PV
+DEFAULT_SCAN_INTERVAL = 5
+DEFAULT_MIN_INTERVAL = 2
+DEFAULT_MAX_INTERVAL = 60
+# Change of any power in W between polls to poll at the fastest interval
+POWER_CHANGE_THRESHOLD = 500
+
+CONF_POWER_DEADBAND = "power_deadband"
+CONF_RELATIVE_DEADBAND = "relative_deadband"
+CONF_PERCENT_DEADBAND = "percent_deadband"
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+CONF_MAX_PUBLISH_INTERVAL = "max_publish_interval"
+# Power sensors publish changes of at least 20 W or 2 % of the last value,
+# rel_* sensors changes of at least 1 percentage point
+DEFAULT_POWER_DEADBAND = 20
+DEFAULT_RELATIVE_DEADBAND = 2
+DEFAULT_PERCENT_DEADBAND = 1
+# Seconds between state writes of power flow sensors
+DEFAULT_MIN_PUBLISH_INTERVAL = 5
+DEFAULT_MAX_PUBLISH_INTERVAL = 300
+
+# Sliding windows in seconds of the power flow statistic sensors
+STATISTIC_WINDOWS = (60, 300)
+# Samples kept per window, enough for 300 s of sub-second pushes
+SAMPLE_CAPACITY = 1024
+
+# Max parallel requests per inverter, the embedded web server is slow
+MAX_CONCURRENT_REQUESTS = 2
+# Max parallel requests of all inverters together
+FLEET_MAX_CONCURRENT_REQUESTS = 4
+# Resolution of the shared poll scheduler in seconds
+FLEET_TICK = 1
+# Slow inverters are polled at most every SLOW_FACTOR times their poll duration
+SLOW_FACTOR = 2
+# Seconds a poll waits for its fetch before serving cached values
+STALE_AFTER = 10
+# Seconds values may be overdue before they are dropped
+STALE_MAX_AGE = 600
+# Keep idle connections open across several poll intervals
+KEEPALIVE_EXPIRY = 60
+# Seconds an unloaded entry keeps its client warm for a following setup
+CLIENT_LINGER = 60
+CONNECT_TIMEOUT = 10
+REQUEST_TIMEOUT = 30
+# Seconds a request may take in total after a request slot is acquired, including
+# auth retries
+REQUEST_DEADLINE = 45
+# Consecutive failed requests until requests fail fast for the cooldown
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 120
+
+CONF_STREAM_PATH = "stream_path"
+# Seconds without a pushed message until the stream counts as down
+STREAM_TIMEOUT = 10
+# Seconds to wait before reconnecting a stream, polling covers the gap
+STREAM_RETRY = 30
+
+# Seconds to collect writes of an endpoint into a single POST
+WRITE_DELAY = 0.5
+
+STORAGE_VERSION = 1
+# Delay in seconds to batch writes of the learned digest challenge
+AUTH_SAVE_DELAY = 10
+# Delay in seconds to batch writes of the cached schema and config values
+CACHE_SAVE_DELAY = 60
+
+TRANSLATION_PATH = "/app/assets/i18n/WeblateTranslations/config/"
+# Translations are cached in storage, refetch them weekly for firmware updates
+TRANSLATION_MAX_AGE = 7 * 24 * 60 * 60
+
+# Only these sections of the large translation file are used
+TRANSLATION_SECTIONS = ("BATTERIES",)
 
 SUPPORTED_LOCALES = ["en", "de", "es", "fr", "it", "hu", "pl", "pt", "ru", "uk"]
 
@@ -2,19 +2,341 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from . import const as fl
+from .metrics import Metrics
+from .samples import PowerflowStatistics
+
 if TYPE_CHECKING:
+    from .api import PushSource
     from .data import FroniusConfigEntry
 
 
+def power_delta(old: dict, new: dict) -> float:
+    """Return the largest change of a power value between two polls."""
+    return max(
+        (
+            abs(new[k] - old[k])
+            for k in new.keys() & old.keys()
+            if k.startswith("P_")
+            and isinstance(new[k], (int, float))
+            and isinstance(old[k], (int, float))
+        ),
+        default=0.0,
+    )
+
+
 class FroniusCoordinator(DataUpdateCoordinator):
     """Fronius custom coordinator."""
 
     config_entry: FroniusConfigEntry
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Init coordinator with a poll interval per endpoint."""
+        super().__init__(*args, **kwargs)
+        self._due = dict.fromkeys(fl.ENDPOINT_INTERVALS, 0.0)
+        self._endpoint_data: dict[str, dict] = {}
+        self._last_data: dict = {}
+        self._last_success = True
+        self._last_restored = False
+        self.metrics = Metrics()
+        self._failures = 0
+        self._power_delta = 0.0
+        self.statistics = PowerflowStatistics()
+        # Data restored from the last run until the first live update
+        self.restored = False
+        # Monotonic time each endpoint's values were last fetched or pushed
+        self._fetched_at: dict[str, float] = {}
+        # Fetch of the running poll, later polls join it instead of overlapping
+        self._fetch: asyncio.Task | None = None
+        self._detached = False
+        # Endpoints fed by a connected push source are not polled
+        self._pushed: set[str] = set()
+
+    @property
+    def schema(self) -> dict[str, dict]:
+        """Return static entity data, keyed like the values in data."""
+        return self.config_entry.runtime_data.client.schema
+
+    def changed_keys(self) -> set[str] | None:
+        """Return keys changed since the last notification, None if all did."""
+        # Availability and the restored attribute change for all keys
+        if (
+            self.last_update_success != self._last_success
+            or self.restored != self._last_restored
+        ):
+            return None
+
+        data = self.data or {}
+        last = self._last_data
+        return {
+            k
+            for k in data.keys() | last.keys()
+            if k not in data or k not in last or data[k] != last[k]
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only listeners whose key changed, context is the key."""
+        changed = self.changed_keys()
+        self._last_data = self.data or {}
+        self._last_success = self.last_update_success
+        self._last_restored = self.restored
+
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or context in changed:
+                update_callback()
+
+    @property
+    def poll_interval(self) -> float:
+        """Return the configured poll interval in seconds."""
+        return self.config_entry.options.get(
+            CONF_SCAN_INTERVAL, fl.DEFAULT_SCAN_INTERVAL
+        )
+
+    def interval(self, endpoint: str) -> float:
+        """Return seconds between fetches of an endpoint, 0 on every poll."""
+        if not fl.ENDPOINT_INTERVALS[endpoint]:
+            return 0
+        return self.config_entry.options.get(
+            fl.CONF_CONFIG_INTERVAL, fl.DEFAULT_CONFIG_INTERVAL
+        )
+
+    def next_interval(self) -> float:
+        """Return seconds until the next poll, adapted to the inverter state."""
+        options = self.config_entry.options
+        fastest = options.get(fl.CONF_MIN_INTERVAL, fl.DEFAULT_MIN_INTERVAL)
+        slowest = options.get(fl.CONF_MAX_INTERVAL, fl.DEFAULT_MAX_INTERVAL)
+
+        if self._failures:
+            # Back off while the inverter does not respond
+            interval = self.poll_interval * 2**self._failures
+        elif self._power_delta >= fl.POWER_CHANGE_THRESHOLD:
+            interval = fastest
+        elif not (self.data or {}).get("P_PV"):
+            # No PV production, e.g. at night
+            interval = slowest
+        else:
+            interval = self.poll_interval
+
+        # Slow inverters are polled less often even beyond the slowest interval
+        cycle = self.metrics.histograms.get("cycle")
+        last = cycle.last if cycle else 0.0
+        return max(min(interval, slowest), last * fl.SLOW_FACTOR)
+
+    def active_endpoints(self) -> set[str]:
+        """Return endpoints backing an enabled entity, all before entities exist."""
+        keys = {context for _, context in self._listeners.values() if context}
+        if not keys:
+            return set(fl.ENDPOINT_INTERVALS)
+
+        schema = self.schema
+        # Endpoints without entities yet are fetched to discover them
+        known = {info["url"] for info in schema.values()}
+        return {schema[key]["url"] for key in keys if key in schema} | (
+            fl.ENDPOINT_INTERVALS.keys() - known
+        )
+
+    def due_endpoints(self) -> list[str]:
+        """Return endpoints which need to be fetched."""
+        now = time.monotonic()
+        active = self.active_endpoints()
+        return [
+            endpoint
+            for endpoint, due in self._due.items()
+            if due <= now and endpoint in active and endpoint not in self._pushed
+        ]
+
+    async def async_refresh_endpoint(self, endpoint: str) -> None:
+        """Re-read a single endpoint, e.g. to confirm a write."""
+        self._due[endpoint] = 0.0
+        try:
+            await self._async_fetch([endpoint])
+        except Exception as err:  # noqa: BLE001
+            fl.LOGGER.warning("Re-reading %s failed: %s", endpoint, err)
+            return
+
+        self.data = self._merge()
+        self.async_update_listeners()
+
+    @callback
+    def async_restore(self, values: dict[str, dict]) -> None:
+        """Show values of the last run until the first live update."""
+        self._endpoint_data = dict(values)
+        # Age counts from the restore, the cache does not record fetch times
+        self._fetched_at = dict.fromkeys(values, time.monotonic())
+        self.data = self._merge()
+        self.restored = True
+
+    @callback
+    def async_set_values(self, endpoint: str, values: dict) -> None:
+        """Apply values of an endpoint locally until it is fetched again."""
+        self._endpoint_data[endpoint] = self._endpoint_data.get(endpoint, {}) | values
+        self.data = self._merge()
+        self.async_update_listeners()
+
+    async def async_run_source(self, source: PushSource) -> None:
+        """Apply pushed values, polling takes over while the source is down."""
+        endpoint = source.endpoint
+
+        @callback
+        def on_values(values: dict) -> None:
+            self._pushed.add(endpoint)
+            self._power_delta = power_delta(
+                self._endpoint_data.get(endpoint, {}), values
+            )
+            self._endpoint_data[endpoint] = values
+            self._fetched_at[endpoint] = time.monotonic()
+            if endpoint == fl.ENDPOINT_POWERFLOW:
+                self.statistics.add(time.monotonic(), values)
+            self.data = self._merge()
+            self.async_update_listeners()
+
+        while True:
+            try:
+                await source.async_run(on_values)
+            except Exception as err:  # noqa: BLE001
+                fl.LOGGER.debug("Push source of %s failed: %s", endpoint, err)
+            finally:
+                self._pushed.discard(endpoint)
+            await asyncio.sleep(fl.STREAM_RETRY)
+
+    async def async_write(self, endpoint: str, changes: dict, values: dict) -> None:
+        """Write changes, showing their values optimistically until re-read."""
+        self.async_set_values(endpoint, values)
+
+        # Re-read once the POST is done or failed, shared by all writes posted
+        # with it, so coalesced writes never restore each other's values
+        await self.config_entry.runtime_data.client.async_write(
+            endpoint, changes, confirm=self.async_refresh_endpoint
+        )
+
+    async def _async_fetch(self, endpoints: list[str]) -> None:
+        """Fetch endpoints into the per endpoint cache."""
+        result = await self.config_entry.runtime_data.client.async_get_data(endpoints)
+
+        now = time.monotonic()
+        if fl.ENDPOINT_POWERFLOW in result:
+            self._power_delta = power_delta(
+                self._endpoint_data.get(fl.ENDPOINT_POWERFLOW, {}),
+                result[fl.ENDPOINT_POWERFLOW],
+            )
+            self.statistics.add(now, result[fl.ENDPOINT_POWERFLOW])
+
+        # Failed endpoints keep their last values until they expire
+        for endpoint, values in result.items():
+            self._endpoint_data[endpoint] = values
+            self._fetched_at[endpoint] = now
+            self._due[endpoint] = now + self.interval(endpoint)
+
+    def _expire(self) -> None:
+        """Drop values overdue by more than the stale max age."""
+        now = time.monotonic()
+        for endpoint, fetched in list(self._fetched_at.items()):
+            if now - fetched > self.interval(endpoint) + fl.STALE_MAX_AGE:
+                self._endpoint_data.pop(endpoint, None)
+                del self._fetched_at[endpoint]
+
+    def ages(self) -> dict[str, float]:
+        """Return seconds since the values of each endpoint were fetched."""
+        now = time.monotonic()
+        return {
+            endpoint: now - fetched for endpoint, fetched in self._fetched_at.items()
+        }
+
+    def _merge(self) -> dict:
+        """Return values of all endpoints."""
+        data = {}
+        for values in self._endpoint_data.values():
+            data |= values
+        return data
+
+    def diagnostics(self) -> dict[str, float | None]:
+        """Return key figures for the diagnostic sensors."""
+        client = self.config_entry.runtime_data.client
+        cycle = self.metrics.histograms.get("cycle")
+        return {
+            "cycle_duration": cycle.last if cycle else None,
+            "overruns": self.metrics.counters["overruns"],
+            "requests": client.connection_stats["requests"],
+            "auth_retries": sum(
+                metrics.counters["auth_retries"] for metrics in client.metrics.values()
+            ),
+            "data_age": max(self.ages().values(), default=None),
+        }
+
     async def _async_update_data(self) -> dict:
         """Update data via library."""
-        return await self.config_entry.runtime_data.client.async_get_data()
+        start = time.perf_counter()
+        try:
+            return await self._async_update_endpoints()
+        finally:
+            seconds = time.perf_counter() - start
+            self.metrics.observe("cycle", seconds)
+            if seconds > self.poll_interval:
+                self.metrics.count("overruns")
+
+    async def _async_update_endpoints(self) -> dict:
+        """Fetch due endpoints, serving cached values while slow or failing."""
+        if self._fetch is None:
+            endpoints = self.due_endpoints()
+            if not endpoints:
+                self.metrics.count("skipped")
+                self._expire()
+                return self._merge()
+            self._detached = False
+            self._fetch = self.hass.async_create_background_task(
+                self._async_fetch_due(endpoints), "fronius_local fetch"
+            )
+        else:
+            self.metrics.count("joined")
+
+        fetch = self._fetch
+        done, _ = await asyncio.wait({fetch}, timeout=fl.STALE_AFTER)
+        if not done:
+            self._expire()
+            if self._endpoint_data:
+                # The fetch publishes its result when it completes
+                self._detached = True
+                self.metrics.count("stale")
+                return self._merge()
+
+        err = await asyncio.shield(fetch)
+        # Also on success, endpoints failing alongside working ones expire
+        self._expire()
+        if err is not None:
+            if not self._endpoint_data:
+                raise err
+            fl.LOGGER.warning("Update failed, serving cached values: %s", err)
+        return self._merge()
+
+    async def _async_fetch_due(self, endpoints: list[str]) -> Exception | None:
+        """Fetch endpoints of a poll, return the error instead of raising it."""
+        try:
+            await self._async_fetch(endpoints)
+        except Exception as err:  # noqa: BLE001
+            self._failures += 1
+            error = err
+        else:
+            self._failures = 0
+            self.restored = False
+            error = None
+        finally:
+            self._fetch = None
+
+        if self._detached:
+            # The poll already returned cached values, publish the outcome
+            self._expire()
+            if self._endpoint_data:
+                self.async_set_updated_data(self._merge())
+            else:
+                self.last_update_success = False
+                self.async_update_listeners()
+        return error
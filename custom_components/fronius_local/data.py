@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import asyncio
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
@@ -23,3 +25,4 @@ class FroniusData:
     client: FroniusApiClient
     coordinator: FroniusCoordinator
     integration: Integration
+    stream: asyncio.Task | None = None
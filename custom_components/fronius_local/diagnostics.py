@@ -0,0 +1,37 @@
+"""Diagnostics for Fronius local."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_PASSWORD
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import FroniusConfigEntry
+
+TO_REDACT = {CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    _hass: HomeAssistant,
+    entry: FroniusConfigEntry,
+) -> dict[str, Any]:
+    """Return timings of the requests and polls for tuning."""
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "connection": client.connection_stats,
+        "nonce_lifetime": client.nonce_lifetime,
+        "circuit_open": client.circuit_open,
+        "data_age": coordinator.ages(),
+        "endpoints": {
+            path: metrics.as_dict() for path, metrics in client.metrics.items()
+        },
+        "coordinator": coordinator.metrics.as_dict(),
+        "data": coordinator.data,
+    }
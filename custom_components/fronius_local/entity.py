@@ -2,21 +2,43 @@
 
 from __future__ import annotations
 
+from functools import cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION
 from .coordinator import FroniusCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.helpers.entity import EntityDescription
+
+
+@cache
+def shared_attributes(item_id: str) -> Mapping[str, Any]:
+    """Return read-only state attributes, shared by entities of all inverters."""
+    return MappingProxyType({"id": item_id})
+
 
 class FroniusEntity(CoordinatorEntity[FroniusCoordinator]):
     """FroniusEntity class."""
 
     _attr_attribution = ATTRIBUTION
 
-    def __init__(self, coordinator: FroniusCoordinator, unique_id: str) -> None:
-        """Initialize."""
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator: FroniusCoordinator,
+        unique_id: str,
+        entity_description: EntityDescription,
+    ) -> None:
+        """Initialize, listening only to changes of the own key."""
+        super().__init__(coordinator, context=entity_description.key)
+        self.entity_description = entity_description
         self._attr_unique_id = unique_id
         self._attr_device_info = DeviceInfo(
             identifiers={
@@ -26,3 +48,39 @@ class FroniusEntity(CoordinatorEntity[FroniusCoordinator]):
                 ),
             },
         )
+        # Bound once, static data of a key does not change between polls
+        self._key = entity_description.key
+        self._info = coordinator.schema.get(self._key)
+        self._attributes = shared_attributes(self._info["id"]) if self._info else None
+        self._value = (coordinator.data or {}).get(self._key)
+
+    async def async_added_to_hass(self) -> None:
+        """Re-read the value, a background refresh may have updated it meanwhile."""
+        await super().async_added_to_hass()
+        self._value = (self.coordinator.data or {}).get(self._key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Look up the value once per update instead of on every read."""
+        self._value = (self.coordinator.data or {}).get(self._key)
+        super()._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Return attributes, marked while values are restored from the last run."""
+        if self._attributes is not None and self.coordinator.restored:
+            return {**self._attributes, "restored": True}
+        return self._attributes
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self._key in (self.coordinator.data or {})
+
+    def info(self) -> dict:
+        """Fetch static entity data."""
+        return self._info
+
+    def value(self) -> Any:
+        """Fetch entity value."""
+        return self._value
@@ -0,0 +1,100 @@
+"""Scheduler and resources shared by all Fronius inverters."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from . import const as fl
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+    from .api import FroniusApiClient
+    from .coordinator import FroniusCoordinator
+
+
+def get_fleet(hass: HomeAssistant) -> FroniusFleet:
+    """Return the fleet of this Home Assistant instance."""
+    if fl.DOMAIN not in hass.data:
+        hass.data[fl.DOMAIN] = FroniusFleet(hass)
+    return hass.data[fl.DOMAIN]
+
+
+class FroniusFleet:
+    """Polls all inverters staggered and caps their concurrent requests."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init fleet."""
+        self.hass = hass
+        self.clients: dict[str, FroniusApiClient] = {}
+        self.semaphore = asyncio.Semaphore(fl.FLEET_MAX_CONCURRENT_REQUESTS)
+        # Translations only depend on the locale, share them between inverters
+        self.translations: dict[str, dict] = {}
+        self.translation_lock = asyncio.Lock()
+        self._next: dict[FroniusCoordinator, float] = {}
+        self._running: set[FroniusCoordinator] = set()
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, coordinator: FroniusCoordinator) -> CALLBACK_TYPE:
+        """Schedule polls of a coordinator, return a callback to remove it."""
+        self._next[coordinator] = 0.0
+        self._stagger()
+        if self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=fl.FLEET_TICK)
+            )
+
+        @callback
+        def remove() -> None:
+            self._next.pop(coordinator, None)
+            if not self._next and self._unsub_tick is not None:
+                self._unsub_tick()
+                self._unsub_tick = None
+
+        return remove
+
+    @callback
+    def async_reschedule(self, coordinator: FroniusCoordinator) -> None:
+        """Apply a shorter poll interval without waiting for the scheduled poll."""
+        if coordinator in self._next:
+            self._next[coordinator] = min(
+                self._next[coordinator], time.monotonic() + coordinator.next_interval()
+            )
+
+    def _stagger(self) -> None:
+        """Spread the next polls evenly over the poll interval."""
+        now = time.monotonic()
+        count = len(self._next)
+        for idx, coordinator in enumerate(self._next):
+            self._next[coordinator] = (
+                now + coordinator.next_interval() * (idx + 1) / count
+            )
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Start polls which are due and not running anymore."""
+        now = time.monotonic()
+        for coordinator, due in self._next.items():
+            if due <= now and coordinator not in self._running:
+                self._running.add(coordinator)
+                self.hass.async_create_background_task(
+                    self._async_poll(coordinator, now), "fronius_local poll"
+                )
+
+    async def _async_poll(self, coordinator: FroniusCoordinator, start: float) -> None:
+        """Poll a coordinator, slow inverters are polled less often."""
+        try:
+            await coordinator.async_refresh()
+        finally:
+            self._running.discard(coordinator)
+            if coordinator in self._next:
+                self._next[coordinator] = start + coordinator.next_interval()
@@ -0,0 +1,67 @@
+"""Timing metrics for Fronius local."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+# Upper bounds of the histogram buckets in seconds
+BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Histogram of durations with fixed buckets."""
+
+    __slots__ = ("count", "counts", "last", "max", "total")
+
+    def __init__(self) -> None:
+        """Init histogram."""
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add a duration."""
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict:
+        """Return histogram for diagnostics."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "last": self.last,
+            "max": self.max,
+            "buckets": {
+                f"le_{bound}": count
+                for bound, count in zip((*BUCKETS, "inf"), self.counts, strict=True)
+            },
+        }
+
+
+class Metrics:
+    """Histograms and counters, keyed by name."""
+
+    def __init__(self) -> None:
+        """Init metrics."""
+        self.histograms: defaultdict[str, Histogram] = defaultdict(Histogram)
+        self.counters: Counter[str] = Counter()
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Add a duration to a histogram."""
+        self.histograms[name].observe(seconds)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increase a counter."""
+        self.counters[name] += amount
+
+    def as_dict(self) -> dict:
+        """Return metrics for diagnostics."""
+        return dict(self.counters) | {
+            name: histogram.as_dict() for name, histogram in self.histograms.items()
+        }
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from functools import cache
 from typing import TYPE_CHECKING
 
 from homeassistant.components.number import (
@@ -23,6 +24,12 @@ if TYPE_CHECKING:
     from .data import FroniusConfigEntry
 
 
+@cache
+def _description(key: str, name: str) -> NumberEntityDescription:
+    """Return the description of a key, shared by entities of all inverters."""
+    return NumberEntityDescription(key=key, name=name)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: FroniusConfigEntry,
@@ -33,12 +40,9 @@ async def async_setup_entry(
         FroniusNumber(
             coordinator=entry.runtime_data.coordinator,
             unique_id=k.lower(),
-            entity_description=NumberEntityDescription(
-                key=k,
-                name=v["name"],
-            ),
+            entity_description=_description(k, v["name"]),
         )
-        for k, v in entry.runtime_data.coordinator.data.items()
+        for k, v in entry.runtime_data.coordinator.schema.items()
         if v["type"] == Platform.NUMBER
     )
 
@@ -53,11 +57,10 @@ class FroniusNumber(FroniusEntity, NumberEntity):
         entity_description: NumberEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator, unique_id)
-        self.entity_description = entity_description
+        super().__init__(coordinator, unique_id, entity_description)
         self.entity_id = "number." + unique_id
 
-        val = self.data()["val"]
+        val = self.info()["val"]
         if val is not None:
             val = val["default"]["ranges"]["default_range"]
             if val.get("lowerBound") is not None:
@@ -70,22 +73,18 @@ class FroniusNumber(FroniusEntity, NumberEntity):
             else:
                 self.native_max_value = sys.float_info.max
 
-        self.extra_state_attributes = {"id": self.data()["id"]}
-
         self.mode = NumberMode.BOX
-        self.native_unit_of_measurement = self.data()["unit"]
+        self.native_unit_of_measurement = self.info()["unit"]
 
     @property
     def native_value(self) -> float | None:
         """Return the native value of the sensor."""
-        return self.data()["value"]
+        return self.value()
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self.coordinator.config_entry.runtime_data.client.post(
-            self.data()["url"], {self.data()["id"]: int(value)}
+        await self.coordinator.async_write(
+            self.info()["url"],
+            {self.info()["id"]: int(value)},
+            {self.entity_description.key: int(value)},
         )
-
-    def data(self) -> dict:
-        """Fetch entity data."""
-        return self.coordinator.data[self.entity_description.key]
@@ -0,0 +1,58 @@
+"""Publishing policy of power flow sensors for Fronius local."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from . import const as fl
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@dataclass(frozen=True, slots=True)
+class PublishPolicy:
+    """When a new value of a sensor is worth a state write."""
+
+    # Smallest change to publish, absolute and as fraction of the last value
+    absolute: float
+    relative: float
+    # Seconds between publishes, at least min_interval and at most max_interval
+    # even without a significant change
+    min_interval: float
+    max_interval: float
+
+    def significant(self, last: Any, value: Any) -> bool:
+        """Check if a value differs enough from the last published one."""
+        if not isinstance(last, (int, float)) or not isinstance(value, (int, float)):
+            return last != value
+        return abs(value - last) >= max(self.absolute, self.relative * abs(last))
+
+
+def publish_policy(key: str, options: Mapping[str, Any]) -> PublishPolicy | None:
+    """Return the policy of a power flow key, None to publish every change."""
+    if key.startswith("P_"):
+        absolute = options.get(fl.CONF_POWER_DEADBAND, fl.DEFAULT_POWER_DEADBAND)
+        relative = options.get(fl.CONF_RELATIVE_DEADBAND, fl.DEFAULT_RELATIVE_DEADBAND)
+    elif key.startswith("rel_"):
+        absolute = options.get(fl.CONF_PERCENT_DEADBAND, fl.DEFAULT_PERCENT_DEADBAND)
+        relative = 0
+    else:
+        return None
+
+    return _policy(
+        absolute,
+        relative / 100,
+        options.get(fl.CONF_MIN_PUBLISH_INTERVAL, fl.DEFAULT_MIN_PUBLISH_INTERVAL),
+        options.get(fl.CONF_MAX_PUBLISH_INTERVAL, fl.DEFAULT_MAX_PUBLISH_INTERVAL),
+    )
+
+
+@cache
+def _policy(
+    absolute: float, relative: float, min_interval: float, max_interval: float
+) -> PublishPolicy:
+    """Return a policy, shared by all sensors with the same options."""
+    return PublishPolicy(absolute, relative, min_interval, max_interval)
@@ -0,0 +1,148 @@
+"""Windowed statistics of power flow samples for Fronius local."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+
+from . import const as fl
+
+STATS = ("mean", "min", "max", "energy")
+
+
+def has_statistics(key: str) -> bool:
+    """Check if statistics are kept for a power flow key."""
+    return key.startswith(("P_", "rel_"))
+
+
+class RingBuffer:
+    """Fixed-size buffer of timestamped samples, backed by arrays."""
+
+    __slots__ = ("_start", "_times", "_values", "size")
+
+    def __init__(self, capacity: int) -> None:
+        """Init buffer."""
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._start = 0
+        self.size = 0
+
+    @property
+    def full(self) -> bool:
+        """Return if the next sample overwrites the oldest one."""
+        return self.size == len(self._times)
+
+    def __getitem__(self, idx: int) -> tuple[float, float]:
+        """Return time and value, 0 is the oldest and -1 the newest sample."""
+        pos = (self._start + idx % self.size) % len(self._times)
+        return self._times[pos], self._values[pos]
+
+    def append(self, time: float, value: float) -> None:
+        """Add a sample, the buffer must not be full."""
+        pos = (self._start + self.size) % len(self._times)
+        self._times[pos] = time
+        self._values[pos] = value
+        self.size += 1
+
+    def popleft(self) -> tuple[float, float]:
+        """Remove and return the oldest sample."""
+        sample = self[0]
+        self._start = (self._start + 1) % len(self._times)
+        self.size -= 1
+        return sample
+
+
+class WindowStats:
+    """Mean, min, max and energy of the samples within a sliding window."""
+
+    __slots__ = ("_integral", "_max", "_min", "_samples", "window")
+
+    def __init__(self, window: float, capacity: int) -> None:
+        """Init window."""
+        self.window = window
+        self._samples = RingBuffer(capacity)
+        # Trapezoid integral of the value over time, updated incrementally
+        self._integral = 0.0
+        # Monotonic queues, the front is the min or max of the window
+        self._min: deque[tuple[float, float]] = deque()
+        self._max: deque[tuple[float, float]] = deque()
+
+    def add(self, time: float, value: float) -> None:
+        """Add a sample and drop the ones which left the window."""
+        samples = self._samples
+        if samples.size:
+            last_time, last_value = samples[-1]
+            self._integral += (last_value + value) / 2 * (time - last_time)
+        if samples.full:
+            self._evict()
+        samples.append(time, value)
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((time, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((time, value))
+
+        while samples.size > 1 and samples[0][0] < time - self.window:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop the oldest sample."""
+        time, value = self._samples.popleft()
+        if self._samples.size:
+            next_time, next_value = self._samples[0]
+            self._integral -= (value + next_value) / 2 * (next_time - time)
+        else:
+            self._integral = 0.0
+
+        if self._min and self._min[0][0] <= time:
+            self._min.popleft()
+        if self._max and self._max[0][0] <= time:
+            self._max.popleft()
+
+    def value(self, stat: str) -> float | None:
+        """Return a statistic of the window, None without samples."""
+        samples = self._samples
+        if not samples.size:
+            return None
+        if stat == "min":
+            return self._min[0][1]
+        if stat == "max":
+            return self._max[0][1]
+
+        duration = samples[-1][0] - samples[0][0]
+        if stat == "energy":
+            # W over seconds to Wh
+            return self._integral / 3600
+        # Time weighted, the poll interval adapts
+        return self._integral / duration if duration else samples[-1][1]
+
+
+class PowerflowStatistics:
+    """Sliding window statistics per power flow key."""
+
+    def __init__(self) -> None:
+        """Init statistics."""
+        self._windows: dict[str, dict[int, WindowStats]] = {}
+
+    def add(self, time: float, values: dict) -> None:
+        """Add the numeric values of a power flow update."""
+        for key, value in values.items():
+            if not has_statistics(key) or not isinstance(value, (int, float)):
+                continue
+            windows = self._windows.get(key)
+            if windows is None:
+                windows = self._windows[key] = {
+                    window: WindowStats(window, fl.SAMPLE_CAPACITY)
+                    for window in fl.STATISTIC_WINDOWS
+                }
+            for stats in windows.values():
+                stats.add(time, value)
+
+    def value(self, key: str, window: int, stat: str) -> float | None:
+        """Return a statistic of a key, None without samples."""
+        windows = self._windows.get(key)
+        if windows is None:
+            return None
+        return windows[window].value(stat)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import (
@@ -10,11 +13,25 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import Platform
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    Platform,
+    UnitOfEnergy,
+    UnitOfPower,
+    UnitOfTime,
+)
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
 
+from . import const as fl
 from .entity import FroniusEntity
+from .publish import publish_policy
+from .samples import STATS, has_statistics
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -22,6 +39,101 @@ if TYPE_CHECKING:
     from .data import FroniusConfigEntry
 
 
+DIAGNOSTIC_SENSORS = (
+    SensorEntityDescription(
+        key="cycle_duration",
+        name="Poll duration",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key="overruns",
+        name="Poll overruns",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key="requests",
+        name="Requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key="data_age",
+        name="Data age",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key="auth_retries",
+        name="Auth retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class FroniusStatisticDescription(SensorEntityDescription):
+    """Description of a windowed statistic of a power flow key."""
+
+    source: str
+    window: int
+    stat: str
+
+
+@cache
+def _statistic_description(
+    source: str, window: int, stat: str
+) -> FroniusStatisticDescription:
+    """Return the description of a statistic, shared by all inverters."""
+    if stat == "energy":
+        unit, device_class, state_class = (
+            UnitOfEnergy.WATT_HOUR,
+            SensorDeviceClass.ENERGY,
+            None,
+        )
+    elif source.startswith("P_"):
+        unit, device_class, state_class = (
+            UnitOfPower.WATT,
+            SensorDeviceClass.POWER,
+            SensorStateClass.MEASUREMENT,
+        )
+    else:
+        unit, device_class, state_class = (
+            PERCENTAGE,
+            SensorDeviceClass.POWER_FACTOR,
+            SensorStateClass.MEASUREMENT,
+        )
+
+    return FroniusStatisticDescription(
+        key=f"{source}_{stat}_{window}",
+        name=f"{source} {stat} {window} s",
+        native_unit_of_measurement=unit,
+        device_class=device_class,
+        state_class=state_class,
+        entity_registry_enabled_default=False,
+        source=source,
+        window=window,
+        stat=stat,
+    )
+
+
+@cache
+def _description(key: str, name: str) -> SensorEntityDescription:
+    """Return the description of a key, shared by entities of all inverters."""
+    return SensorEntityDescription(key=key, name=name)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: FroniusConfigEntry,
@@ -32,14 +144,31 @@ async def async_setup_entry(
         FroniusSensor(
             coordinator=entry.runtime_data.coordinator,
             unique_id=k.lower(),
-            entity_description=SensorEntityDescription(
-                key=k,
-                name=v["name"],
-            ),
+            entity_description=_description(k, v["name"]),
         )
-        for k, v in entry.runtime_data.coordinator.data.items()
+        for k, v in entry.runtime_data.coordinator.schema.items()
         if v["type"] == Platform.SENSOR
     )
+    async_add_entities(
+        FroniusDiagnosticSensor(
+            coordinator=entry.runtime_data.coordinator,
+            unique_id="diagnostic_" + description.key,
+            entity_description=description,
+        )
+        for description in DIAGNOSTIC_SENSORS
+    )
+    async_add_entities(
+        FroniusStatisticSensor(
+            coordinator=entry.runtime_data.coordinator,
+            unique_id=f"{k}_{stat}_{window}".lower(),
+            entity_description=_statistic_description(k, window, stat),
+        )
+        for k, v in entry.runtime_data.coordinator.schema.items()
+        if v["url"] == fl.ENDPOINT_POWERFLOW and has_statistics(k)
+        for window in fl.STATISTIC_WINDOWS
+        for stat in STATS
+        if stat != "energy" or k.startswith("P_")
+    )
 
 
 class FroniusSensor(FroniusEntity, SensorEntity):
@@ -52,14 +181,11 @@ class FroniusSensor(FroniusEntity, SensorEntity):
         entity_description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator, unique_id)
-        self.entity_description = entity_description
+        super().__init__(coordinator, unique_id, entity_description)
         self.entity_id = "sensor." + unique_id
 
-        self.extra_state_attributes = {"id": self.data()["id"]}
-
-        if self.data()["unit"] is not None:
-            self.native_unit_of_measurement = self.data()["unit"]
+        if self.info()["unit"] is not None:
+            self.native_unit_of_measurement = self.info()["unit"]
 
         if self.entity_description.key.startswith("P_"):
             self.native_unit_of_measurement = "W"
@@ -72,11 +198,118 @@ class FroniusSensor(FroniusEntity, SensorEntity):
             self.device_class = SensorDeviceClass.POWER_FACTOR
             self.state_class = SensorStateClass.MEASUREMENT
 
+        self._published = 0.0
+        # Availability of the last write, flips are always written
+        self._published_available: bool | None = None
+        self._unsub_publish: CALLBACK_TYPE | None = None
+        self.async_on_remove(self._async_cancel_publish)
+
     @property
     def native_value(self) -> str | None:
         """Return the native value of the sensor."""
-        return self.data()["value"]
+        return self.value()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write significant changes only, at most every min publish interval."""
+        policy = publish_policy(self._key, self.coordinator.config_entry.options)
+        value = (self.coordinator.data or {}).get(self._key)
+        if (
+            policy is None
+            or value is None
+            or self._value is None
+            or not self.coordinator.last_update_success
+            or self.available != self._published_available
+        ):
+            self._publish()
+            return
+
+        elapsed = time.monotonic() - self._published
+        if not policy.significant(self._value, value):
+            if elapsed >= policy.max_interval:
+                self._publish()
+        elif elapsed >= policy.min_interval:
+            self._publish()
+        elif self._unsub_publish is None:
+            # Publish the latest value once the min interval is over
+            self._unsub_publish = async_call_later(
+                self.hass, policy.min_interval - elapsed, self._async_publish_later
+            )
+
+    @callback
+    def _async_publish_later(self, _now: datetime) -> None:
+        """Publish a change held back by the min publish interval."""
+        self._unsub_publish = None
+        self._publish()
+
+    @callback
+    def _publish(self) -> None:
+        """Write the current value to the state machine."""
+        self._async_cancel_publish()
+        self._published = time.monotonic()
+        self._published_available = self.available
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_cancel_publish(self) -> None:
+        """Cancel a held back publish."""
+        if self._unsub_publish is not None:
+            self._unsub_publish()
+            self._unsub_publish = None
+
+
+class FroniusDiagnosticSensor(FroniusEntity, SensorEntity):
+    """Sensor for the poll and request metrics."""
+
+    def __init__(
+        self,
+        coordinator: FroniusCoordinator,
+        unique_id: str,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, unique_id, entity_description)
+        self.entity_id = "sensor." + unique_id
+        # Not a value of the inverter, update on every refresh
+        self.coordinator_context = None
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return True
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the native value of the sensor."""
+        return self.coordinator.diagnostics()[self.entity_description.key]
 
-    def data(self) -> dict:
-        """Fetch entity data."""
-        return self.coordinator.data[self.entity_description.key]
+
+class FroniusStatisticSensor(FroniusEntity, SensorEntity):
+    """Sensor for a windowed statistic of a power flow key."""
+
+    entity_description: FroniusStatisticDescription
+
+    def __init__(
+        self,
+        coordinator: FroniusCoordinator,
+        unique_id: str,
+        entity_description: FroniusStatisticDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, unique_id, entity_description)
+        self.entity_id = "sensor." + unique_id
+        # Changes along with the sampled key
+        self.coordinator_context = entity_description.source
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.last_update_success and self.native_value is not None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the native value of the sensor."""
+        description = self.entity_description
+        return self.coordinator.statistics.value(
+            description.source, description.window, description.stat
+        )
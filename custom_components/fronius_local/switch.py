@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
@@ -17,6 +18,12 @@ if TYPE_CHECKING:
     from .data import FroniusConfigEntry
 
 
+@cache
+def _description(key: str, name: str) -> SwitchEntityDescription:
+    """Return the description of a key, shared by entities of all inverters."""
+    return SwitchEntityDescription(key=key, name=name)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: FroniusConfigEntry,
@@ -27,12 +34,9 @@ async def async_setup_entry(
         FroniusSwitch(
             coordinator=entry.runtime_data.coordinator,
             unique_id=k.lower(),
-            entity_description=SwitchEntityDescription(
-                key=k,
-                name=v["name"],
-            ),
+            entity_description=_description(k, v["name"]),
         )
-        for k, v in entry.runtime_data.coordinator.data.items()
+        for k, v in entry.runtime_data.coordinator.schema.items()
         if v["type"] == Platform.SWITCH
     )
 
@@ -47,29 +51,26 @@ class FroniusSwitch(FroniusEntity, SwitchEntity):
         entity_description: SwitchEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator, unique_id)
-        self.entity_description = entity_description
+        super().__init__(coordinator, unique_id, entity_description)
         self.entity_id = "switch." + unique_id
 
-        self.extra_state_attributes = {"id": self.data()["id"]}
-
     @property
     def is_on(self) -> bool | None:
         """Return the native value of the sensor."""
-        return self.data()["value"]
+        return self.value()
 
     async def async_turn_on(self, **_kwargs: any) -> None:
         """Turn the entity on."""
-        await self.coordinator.config_entry.runtime_data.client.async_set_timeofuse(
-            self.data()["nr"], active=True
+        await self.coordinator.async_write(
+            self.info()["url"],
+            {self.info()["nr"]: True},
+            {self.entity_description.key: True},
         )
 
     async def async_turn_off(self, **_kwargs: any) -> None:
         """Turn the entity on."""
-        await self.coordinator.config_entry.runtime_data.client.async_set_timeofuse(
-            self.data()["nr"], active=False
+        await self.coordinator.async_write(
+            self.info()["url"],
+            {self.info()["nr"]: False},
+            {self.entity_description.key: False},
         )
-
-    def data(self) -> dict:
-        """Fetch entity data."""
-        return self.coordinator.data[self.entity_description.key]
@@ -0,0 +1,111 @@
+"""Benchmark FroniusApiClient polls against the mock inverter."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+from fronius_local import api
+from homeassistant.core import HomeAssistant
+
+MOCK = Path(__file__).with_name("mock_inverter.py")
+PASSWORD = "password"  # noqa: S105
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def mock_stats(url: str) -> dict[str, int]:
+    """Return request counters of the mock inverter."""
+    async with httpx.AsyncClient(base_url=url) as client:
+        return (await client.get("/mock/stats")).json()
+
+
+async def run(args: argparse.Namespace, url: str) -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            client = await api.async_get_client(hass, url, PASSWORD)
+
+            start = time.perf_counter()
+            await client.async_get_data()
+            cold = time.perf_counter() - start
+
+            before = await mock_stats(url)
+            latencies = []
+            for _ in range(args.polls):
+                start = time.perf_counter()
+                await client.async_get_data()
+                latencies.append(time.perf_counter() - start)
+            after = await mock_stats(url)
+
+            # Separate pass, tracing slows down the timed polls
+            tracemalloc.start()
+            peaks = []
+            for _ in range(args.alloc_polls):
+                current = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                await client.async_get_data()
+                peaks.append(tracemalloc.get_traced_memory()[1] - current)
+            tracemalloc.stop()
+
+            await client.async_close()
+        finally:
+            await hass.async_stop(force=True)
+
+    polls = args.polls
+    ms = [latency * 1000 for latency in latencies]
+    print(f"cold poll          {cold * 1000:8.1f} ms")  # noqa: T201
+    for pct in (50, 90, 99):
+        print(f"poll p{pct:<2}           {percentile(ms, pct):8.1f} ms")  # noqa: T201
+    print(f"poll max           {max(ms):8.1f} ms")  # noqa: T201
+    print(f"poll mean          {statistics.fmean(ms):8.1f} ms")  # noqa: T201
+    for name in ("requests", "unauthorized", "connections"):
+        print(f"{name + '/poll':<18} {(after[name] - before[name]) / polls:8.2f}")  # noqa: T201
+    print(f"peak alloc/poll    {statistics.fmean(peaks) / 1024:8.1f} KiB")  # noqa: T201
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--polls", type=int, default=200)
+    parser.add_argument("--alloc-polls", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="seconds")
+    parser.add_argument("--nonce-lifetime", type=float, default=300.0, help="seconds")
+    args = parser.parse_args()
+
+    # Separate process, so its allocations and GIL time don't skew the results
+    mock = subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            str(MOCK),
+            "--port=0",
+            f"--password={PASSWORD}",
+            f"--latency={args.latency}",
+            f"--jitter={args.jitter}",
+            f"--nonce-lifetime={args.nonce_lifetime}",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        asyncio.run(run(args, mock.stdout.readline().strip()))
+    finally:
+        mock.terminate()
+
+
+if __name__ == "__main__":
+    main()
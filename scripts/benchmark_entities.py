@@ -0,0 +1,164 @@
+"""Benchmark memory and state reads of the entity classes."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+import types
+from typing import TYPE_CHECKING
+
+from fronius_local import const as fl
+from fronius_local import number, sensor, switch
+from fronius_local.coordinator import FroniusCoordinator
+from fronius_local.number import FroniusNumber
+from fronius_local.sensor import FroniusSensor
+from fronius_local.switch import FroniusSwitch
+from homeassistant.components.number import NumberEntityDescription
+from homeassistant.components.sensor import SensorEntityDescription
+from homeassistant.components.switch import SwitchEntityDescription
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.helpers.entity import EntityDescription
+
+
+def describe(
+    platform: types.ModuleType, cls: type[EntityDescription]
+) -> Callable[[str, str], EntityDescription]:
+    """Return how a platform describes a key, like the tree under test does."""
+    shared = getattr(platform, "_description", None)
+    if shared is not None:
+        return shared
+
+    # Trees before shared descriptions create one per entity
+    def description(key: str, name: str) -> EntityDescription:
+        return cls(key=key, name=name)
+
+    return description
+
+
+def make_schema(args: argparse.Namespace) -> tuple[dict, dict]:
+    """Return schema and values of one inverter."""
+    schema = {}
+    data = {}
+    for idx in range(args.sensors):
+        key = f"P_{idx}"
+        schema[key] = {
+            "type": Platform.SENSOR,
+            "name": key,
+            "id": key,
+            "url": fl.ENDPOINT_POWERFLOW,
+            "unit": None,
+        }
+        data[key] = float(idx)
+    for idx in range(args.numbers):
+        key = f"conf_batteries_BAT_{idx}"
+        schema[key] = {
+            "type": Platform.NUMBER,
+            "name": key,
+            "id": f"BAT_{idx}",
+            "url": fl.ENDPOINT_BATTERIES,
+            "unit": "%",
+            "val": None,
+        }
+        data[key] = idx
+    for idx in range(args.switches):
+        key = f"timeuse_{idx + 1}"
+        schema[key] = {
+            "type": Platform.SWITCH,
+            "name": key,
+            "id": key,
+            "nr": idx,
+            "url": fl.ENDPOINT_TIMEOFUSE,
+            "unit": None,
+        }
+        data[key] = bool(idx % 2)
+    return schema, data
+
+
+def make_entities(hass: HomeAssistant, args: argparse.Namespace, idx: int) -> list:
+    """Create the entities of one inverter."""
+    schema, data = make_schema(args)
+    entry = types.SimpleNamespace(
+        domain=fl.DOMAIN,
+        entry_id=f"entry_{idx}",
+        options={},
+        runtime_data=types.SimpleNamespace(client=types.SimpleNamespace(schema=schema)),
+    )
+    coordinator = FroniusCoordinator(hass=hass, logger=fl.LOGGER, name=fl.DOMAIN)
+    coordinator.config_entry = entry
+    coordinator.data = data
+
+    classes = {
+        Platform.SENSOR: (FroniusSensor, describe(sensor, SensorEntityDescription)),
+        Platform.NUMBER: (FroniusNumber, describe(number, NumberEntityDescription)),
+        Platform.SWITCH: (FroniusSwitch, describe(switch, SwitchEntityDescription)),
+    }
+    entities = []
+    for key, info in schema.items():
+        cls, description = classes[info["type"]]
+        entities.append(
+            cls(
+                coordinator=coordinator,
+                unique_id=f"{idx}_{key.lower()}",
+                entity_description=description(key, info["name"]),
+            )
+        )
+    return entities
+
+
+def read_state(entity: FroniusNumber | FroniusSensor | FroniusSwitch) -> None:
+    """Read the properties a state write reads."""
+    _ = entity.available
+    _ = entity.extra_state_attributes
+    _ = entity.is_on if isinstance(entity, FroniusSwitch) else entity.native_value
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            entities = [
+                entity
+                for idx in range(args.inverters)
+                for entity in make_entities(hass, args, idx)
+            ]
+            allocated = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            for _ in range(args.reads):
+                for entity in entities:
+                    read_state(entity)
+            seconds = time.perf_counter() - start
+        finally:
+            await hass.async_stop(force=True)
+
+    reads = args.reads * len(entities)
+    print(f"entities           {len(entities):8d}")  # noqa: T201
+    print(f"memory/entity      {allocated / len(entities) / 1024:8.2f} KiB")  # noqa: T201
+    print(f"state read         {seconds / reads * 1e6:8.2f} us")  # noqa: T201
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--inverters", type=int, default=10)
+    parser.add_argument("--sensors", type=int, default=40)
+    parser.add_argument("--numbers", type=int, default=10)
+    parser.add_argument("--switches", type=int, default=10)
+    parser.add_argument("--reads", type=int, default=100)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
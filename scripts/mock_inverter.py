@@ -0,0 +1,313 @@
+"""Local stand-in for the Fronius web interface, used for development and benchmarks."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.request import parse_http_list
+
+USER = "customer"
+REALM = "Webinterface area"
+
+BATTERIES = {
+    "BAT_M0_SOC_MIN": 5,
+    "_BAT_M0_SOC_MIN_meta": {
+        "displayType": "Integer",
+        "unit": "%",
+        "validators": {
+            "default": {
+                "ranges": {"default_range": {"lowerBound": 0, "upperBound": 100}}
+            }
+        },
+        "writePermission": {"RoleCustomer": True},
+    },
+    "BAT_M0_SOC_MAX": 100,
+    "_BAT_M0_SOC_MAX_meta": {
+        "displayType": "Integer",
+        "unit": "%",
+        "validators": {
+            "default": {
+                "ranges": {"default_range": {"lowerBound": 0, "upperBound": 100}}
+            }
+        },
+        "writePermission": {"RoleCustomer": True},
+    },
+    "BAT_M0_SOC_MODE": "auto",
+    "_BAT_M0_SOC_MODE_meta": {
+        "displayType": "Enum",
+        "writePermission": {"RoleCustomer": True},
+    },
+    "PV_PEAK_POWER": 10000,
+    "_PV_PEAK_POWER_meta": {
+        "displayType": "Integer",
+        "unit": "W",
+        "writePermission": {"RoleCustomer": True},
+    },
+}
+
+TRANSLATION = {
+    "BATTERIES": {
+        "BAT_M0_SOC_MIN": "Minimum state of charge",
+        "BAT_M0_SOC_MAX": "Maximum state of charge",
+        "BAT_M0_SOC_MODE": "State of charge mode",
+    },
+}
+
+
+class MockInverter:
+    """State of the mocked inverter and its request counters."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        password: str = "password",  # noqa: S107
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        nonce_lifetime: float = 300.0,
+        algorithm: str = "SHA256",
+        push_interval: float = 0.5,
+        etag: bool = False,
+    ) -> None:
+        """Init inverter."""
+        self.password = password
+        self.latency = latency
+        self.jitter = jitter
+        self.nonce_lifetime = nonce_lifetime
+        self.algorithm = algorithm
+        self.push_interval = push_interval
+        self.etag = etag
+        self.batteries = json.loads(json.dumps(BATTERIES))
+        self.timeofuse = [
+            {
+                "Active": True,
+                "Power": 0,
+                "ScheduleType": "CHARGE_MIN",
+                "TimeTable": {"Start": "00:00", "End": "06:00"},
+                "Weekdays": dict.fromkeys(
+                    ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"), True
+                ),
+            },
+            {
+                "Active": False,
+                "Power": 3000,
+                "ScheduleType": "DISCHARGE_MAX",
+                "TimeTable": {"Start": "17:00", "End": "22:00"},
+                "Weekdays": dict.fromkeys(
+                    ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"), True
+                ),
+            },
+        ]
+        self.stats = {"requests": 0, "unauthorized": 0, "connections": 0}
+        self._nonce = ""
+        self._nonce_time = 0.0
+        self._lock = threading.Lock()
+
+    def powerflow(self) -> dict:
+        """Return jittering live power data."""
+        pv = max(0.0, 4000 + random.uniform(-50, 50))  # noqa: S311
+        load = 800 + random.uniform(-20, 20)  # noqa: S311
+        akku = -1500 + random.uniform(-10, 10)  # noqa: S311
+        return {
+            "site": {
+                "P_PV": pv,
+                "P_Load": -load,
+                "P_Akku": akku,
+                "P_Grid": -(pv - load + akku),
+                "rel_Autonomy": 100.0,
+                "rel_SelfConsumption": 100 * load / pv if pv else None,
+            },
+        }
+
+    def nonce(self) -> str:
+        """Return the current nonce, rotated after its lifetime."""
+        with self._lock:
+            if time.monotonic() - self._nonce_time >= self.nonce_lifetime:
+                self._nonce = os.urandom(16).hex()
+                self._nonce_time = time.monotonic()
+            return self._nonce
+
+    def challenge(self) -> str:
+        """Return a digest challenge like the firmware sends."""
+        return (
+            f'Digest realm="{REALM}", qop="auth", algorithm="{self.algorithm}", '
+            f'nonce="{self.nonce()}"'
+        )
+
+    def authorized(self, method: str, header: str | None) -> bool:
+        """Check a digest authorization header, HA1 is always MD5."""
+        if not header or not header.lower().startswith("digest "):
+            return False
+
+        fields = {}
+        for field in parse_http_list(header[7:]):
+            key, _, value = field.strip().partition("=")
+            fields[key] = value.strip('"')
+        if fields.get("nonce") != self.nonce():
+            return False
+
+        name = re.sub(r"-?SESS$", "", self.algorithm.upper()).replace("-", "")
+        hash_func = {"MD5": hashlib.md5, "SHA": hashlib.sha1}.get(name) or getattr(
+            hashlib, name.lower()
+        )
+
+        def digest(*parts: str) -> str:
+            return hash_func(":".join(parts).encode()).hexdigest()
+
+        ha1 = hashlib.md5(f"{USER}:{REALM}:{self.password}".encode()).hexdigest()  # noqa: S324
+        ha2 = digest(method, fields.get("uri", ""))
+        expected = digest(
+            ha1,
+            fields["nonce"],
+            fields.get("nc", ""),
+            fields.get("cnonce", ""),
+            fields.get("qop", ""),
+            ha2,
+        )
+        return fields.get("response") == expected
+
+
+def make_handler(inverter: MockInverter) -> type[BaseHTTPRequestHandler]:
+    """Return a request handler bound to an inverter."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            super().setup()
+            inverter.stats["connections"] += 1
+
+        def log_message(self, *_args: object) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            self._handle(None)
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", 0))
+            self._handle(json.loads(self.rfile.read(length) or b"{}"))
+
+        def _handle(self, body: dict | None) -> None:
+            if self.path == "/mock/stats":
+                self._send(HTTPStatus.OK, inverter.stats)
+                return
+
+            inverter.stats["requests"] += 1
+            time.sleep(max(0.0, inverter.latency + random.uniform(0, inverter.jitter)))  # noqa: S311
+
+            if not inverter.authorized(self.command, self.headers.get("Authorization")):
+                inverter.stats["unauthorized"] += 1
+                self._send(
+                    HTTPStatus.UNAUTHORIZED,
+                    {},
+                    {"X-WWW-Authenticate": inverter.challenge()},
+                )
+                return
+
+            if self.path == "/mock/stream/powerflow":
+                self._stream()
+                return
+
+            data = self._route(body)
+            if data is None:
+                self._send(HTTPStatus.NOT_FOUND, {})
+            elif inverter.etag and body is None and self.path.startswith("/api/config"):
+                etag = '"' + hashlib.md5(json.dumps(data).encode()).hexdigest() + '"'  # noqa: S324
+                if self.headers.get("If-None-Match") == etag:
+                    self._send(HTTPStatus.NOT_MODIFIED, None, {"ETag": etag})
+                else:
+                    self._send(HTTPStatus.OK, data, {"ETag": etag})
+            else:
+                self._send(HTTPStatus.OK, data)
+
+        def _route(self, body: dict | None) -> dict | None:  # noqa: PLR0911
+            path = self.path
+            if path == "/status/version":
+                return {"hardwareId": "MOCK0001", "swrevisions": {"GEN24": "1.36.6-1"}}
+            if path == "/api/status/powerflow":
+                return inverter.powerflow()
+            if path == "/api/config/batteries":
+                if body is not None:
+                    inverter.batteries.update(body)
+                    return {"writeSuccess": list(body)}
+                return inverter.batteries
+            if path == "/api/config/timeofuse":
+                if body is not None:
+                    inverter.timeofuse = body["timeofuse"]
+                    return {"writeSuccess": ["timeofuse"]}
+                return {"timeofuse": inverter.timeofuse}
+            if path.startswith("/app/assets/i18n/WeblateTranslations/config/"):
+                return TRANSLATION
+            return None
+
+        def _stream(self) -> None:
+            """Push power flow as JSON lines until the client disconnects."""
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            try:
+                while True:
+                    self.wfile.write(json.dumps(inverter.powerflow()).encode() + b"\n")
+                    self.wfile.flush()
+                    time.sleep(inverter.push_interval)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def _send(
+            self, status: HTTPStatus, data: dict | None, headers: dict | None = None
+        ) -> None:
+            payload = b"" if data is None else json.dumps(data).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+    return Handler
+
+
+def main() -> None:
+    """Run the mock inverter until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--nonce-lifetime", type=float, default=300.0, help="seconds")
+    parser.add_argument("--algorithm", default="SHA256")
+    parser.add_argument("--push-interval", type=float, default=0.5, help="seconds")
+    parser.add_argument("--etag", action="store_true", help="send ETag on config")
+    args = parser.parse_args()
+
+    inverter = MockInverter(
+        password=args.password,
+        latency=args.latency,
+        jitter=args.jitter,
+        nonce_lifetime=args.nonce_lifetime,
+        algorithm=args.algorithm,
+        push_interval=args.push_interval,
+        etag=args.etag,
+    )
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(inverter))
+    print(f"http://{args.host}:{server.server_port}", flush=True)  # noqa: T201
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()